@@ -43,10 +43,12 @@ Environment variables:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
-import re
 import shlex
 import shutil
 import signal
@@ -54,11 +56,47 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from dataclasses import fields as dataclass_fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+try:
+    import yaml
+    _YAML_C_LOADER = getattr(yaml, "CSafeLoader", None)
+except ImportError:  # PyYAML is optional — fall back to the line parsers
+    yaml = None
+    _YAML_C_LOADER = None
+
+try:
+    # orjson parses 2-3x faster than stdlib json and tolerates leading/
+    # trailing whitespace, so callers can skip the .strip() copy. Its
+    # JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # handlers keep working.
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dump_to(fp: Any, payload: Any, indent: bool) -> None:
+        fp.write(orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 if indent else 0,
+            default=str,
+        ))
+except ImportError:  # orjson is optional — stdlib json works fine
+    _json_loads = json.loads
+
+    def _json_dump_to(fp: Any, payload: Any, indent: bool) -> None:
+        # Stream the encoder output chunk by chunk instead of building
+        # the whole document in memory first.
+        encoder = json.JSONEncoder(indent=2 if indent else None, default=str)
+        for chunk in encoder.iterencode(payload):
+            fp.write(chunk.encode("utf-8"))
 
 
 # =============================================================================
@@ -78,13 +116,39 @@ MAX_TRUNCATION_RETRIES = 3
 CDP_RECOVERY_TIMEOUT = 150          # SSH + script total (seconds)
 CDP_RECOVERY_SCRIPT = "~/dev/rch-mac/scripts/oracle_cdp_recover.js"
 
+# SSH connection multiplexing — repeated recovery attempts reuse one
+# master connection instead of paying a full handshake each time.
+SSH_CONTROL_PATH = "/tmp/apr_auto_ssh_%C"
+SSH_MUX_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={SSH_CONTROL_PATH}",
+    "-o", "ControlPersist=10m",
+]
+
 # Truncation heuristics (applied to round output files)
 MIN_OUTPUT_CHARS = 200
 MIN_OUTPUT_LINES = 5
+TRUNCATION_TAIL_BYTES = 2048  # tail window for partial-word heuristics
+_VOWEL_BYTES = frozenset(b"aeiouyAEIOUY")
 
 # Log management
 MAX_LOG_FILES = 20
 
+# Preflight result cache — rapid restarts within the TTL skip the
+# probe latency (the SSH probe alone can take 15s).
+PREFLIGHT_CACHE_TTL_SECONDS = 60
+
+# Sentinel separating `apr backfill` output from `apr stats` JSON when both
+# run in a single batched invocation.
+STATS_DELIMITER = "---APR-STATS-JSON---"
+
+_UTC = timezone.utc
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string (second precision)."""
+    return datetime.now(_UTC).isoformat(timespec="seconds")
+
 
 # =============================================================================
 # Data Classes
@@ -111,6 +175,10 @@ class Config:
     cdp_recovery_ssh_host: str = ""
     cdp_recovery_script_path: str = ""
     cdp_recovery_timeout: int = CDP_RECOVERY_TIMEOUT
+    apr_client: Optional["AprClient"] = field(
+        default=None, repr=False, compare=False
+    )
+    claude_path: Optional[str] = None
 
     def __post_init__(self):
         self.log_dir = Path(
@@ -138,6 +206,14 @@ class Config:
         if not self.notify_cmd:
             self.notify_cmd = os.environ.get("APR_AUTO_NOTIFY_CMD")
 
+        # Split the notify command once; it never changes after this.
+        try:
+            self._notify_argv = (
+                shlex.split(self.notify_cmd) if self.notify_cmd else []
+            )
+        except ValueError:
+            self._notify_argv = []
+
         if not self.cdp_recovery_ssh_host:
             self.cdp_recovery_ssh_host = os.environ.get(
                 "APR_CDP_RECOVERY_SSH_HOST", ""
@@ -148,8 +224,26 @@ class Config:
                 "APR_CDP_RECOVERY_SCRIPT", CDP_RECOVERY_SCRIPT
             )
 
+        # PATH doesn't change across rounds — probe for Claude Code once
+        # instead of re-walking it from run_integrate every round.
+        if self.claude_path is None:
+            self.claude_path = _which("claude")
+
+        # Subprocess env template, built once — the Oracle settings are
+        # fixed after this point, so per-call os.environ.copy() is waste.
+        env = dict(os.environ)
+        if self.oracle_host and self.oracle_port:
+            env["APR_ORACLE_REMOTE_HOST"] = (
+                f"{self.oracle_host}:{self.oracle_port}"
+            )
+        if self.oracle_token:
+            env["APR_ORACLE_REMOTE_TOKEN"] = self.oracle_token
+        env.setdefault("APR_CHECK_UPDATES", "0")
+        env.setdefault("NO_COLOR", "1")
+        self._subprocess_env = env
 
-@dataclass
+
+@dataclass(slots=True)
 class RoundResult:
     """Result of a single APR round."""
     round_num: int
@@ -164,22 +258,38 @@ class RoundResult:
     integrated: bool = False
     committed: bool = False
     commit_sha: Optional[str] = None
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    # Set explicitly at the call sites — a default factory would hide a
+    # datetime.now() in every construction.
+    timestamp: str = ""
 
+    # Field names resolved once at class definition; asdict() would
+    # re-walk fields() and deep-copy on every round.
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of this result (all values are already plain)."""
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
+
+RoundResult._FIELD_NAMES = tuple(
+    f.name for f in dataclass_fields(RoundResult)
+)
+
+
+@dataclass(slots=True)
 class RunSummary:
-    """Summary of the full orchestration run."""
-    started_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    """Summary of the full orchestration run.
+
+    `results` is preallocated to max_rounds by the orchestrator and
+    filled by index (see _record_result); trailing None slots are
+    trimmed at serialization time.
+    """
+    started_at: str = ""
     finished_at: Optional[str] = None
     stopped_reason: Optional[str] = None
     rounds_completed: int = 0
     rounds_failed: int = 0
-    results: List[Dict[str, Any]] = field(default_factory=list)
+    results: List[Optional[Dict[str, Any]]] = field(default_factory=list)
 
 
 # =============================================================================
@@ -191,10 +301,24 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     """Set up file + console logging with rotation."""
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    # Rotate old logs
-    logs = sorted(log_dir.glob("run_*.log"), key=lambda p: p.stat().st_mtime)
-    while len(logs) >= MAX_LOG_FILES:
-        logs.pop(0).unlink(missing_ok=True)
+    # Rotate old logs — one scandir pass (stat info cached on the
+    # DirEntry), then unlink just the oldest overflow entries.
+    try:
+        with os.scandir(log_dir) as it:
+            logs = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.startswith("run_") and entry.name.endswith(".log")
+            ]
+    except OSError:
+        logs = []
+    if len(logs) >= MAX_LOG_FILES:
+        excess = len(logs) - MAX_LOG_FILES + 1
+        for _, path in heapq.nsmallest(excess, logs):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"run_{ts}.log"
@@ -223,41 +347,111 @@ def setup_logging(log_dir: Path) -> logging.Logger:
     return logger
 
 
+class _LogBuffer:
+    """Logger stand-in that records calls for ordered replay.
+
+    Preflight checks run concurrently but their output should read as
+    the same deterministic sequence as before — each check logs into
+    its own buffer, replayed in submission order once all are done.
+    """
+
+    def __init__(self):
+        self.records: List[Tuple[int, str, tuple]] = []
+
+    def debug(self, msg: str, *args):
+        self.records.append((logging.DEBUG, msg, args))
+
+    def info(self, msg: str, *args):
+        self.records.append((logging.INFO, msg, args))
+
+    def warning(self, msg: str, *args):
+        self.records.append((logging.WARNING, msg, args))
+
+    def error(self, msg: str, *args):
+        self.records.append((logging.ERROR, msg, args))
+
+    def replay(self, logger: logging.Logger):
+        for level, msg, args in self.records:
+            logger.log(level, msg, *args)
+
+
 # =============================================================================
 # Filesystem Helpers
 # =============================================================================
 
 
 def _clean_yaml_value(raw: str) -> str:
-    value = raw.split("#", 1)[0].strip()
-    return value.strip("\"'")
+    # partition avoids split()'s list allocation, and one strip call
+    # drops whitespace and quotes together.
+    return raw.partition("#")[0].strip(" \t\"'")
 
 
-def read_default_workflow(config_path: Path = Path(".apr/config.yaml")) -> Optional[str]:
-    if not config_path.exists():
+def _load_yaml_dict(text: str) -> Optional[Dict[str, Any]]:
+    """Parse YAML with the libyaml C loader, or None if unavailable."""
+    if _YAML_C_LOADER is None:
+        return None
+    try:
+        data = yaml.load(text, Loader=_YAML_C_LOADER)
+    except yaml.YAMLError:
         return None
+    return data if isinstance(data, dict) else None
+
+
+@functools.lru_cache(maxsize=16)
+def _read_default_workflow_cached(
+    config_path_str: str, mtime_ns: int
+) -> Optional[str]:
+    # mtime_ns is part of the cache key so edits invalidate the entry.
     try:
-        for line in config_path.read_text().splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            if stripped.startswith("default_workflow:"):
-                _, value = stripped.split(":", 1)
-                value = _clean_yaml_value(value)
-                return value or None
+        text = Path(config_path_str).read_text()
     except OSError:
         return None
+
+    data = _load_yaml_dict(text)
+    if data is not None:
+        value = data.get("default_workflow")
+        return str(value) if value else None
+
+    # Fallback: hand-rolled line parser (no libyaml available)
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("default_workflow:"):
+            _, value = stripped.split(":", 1)
+            value = _clean_yaml_value(value)
+            return value or None
     return None
 
 
-def read_rounds_output_dir(workflow_file: Path) -> Optional[str]:
-    if not workflow_file.exists():
+def read_default_workflow(config_path: Path = Path(".apr/config.yaml")) -> Optional[str]:
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return None
+    return _read_default_workflow_cached(str(config_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_rounds_output_dir_cached(
+    workflow_file_str: str, mtime_ns: int
+) -> Optional[str]:
+    # mtime_ns is part of the cache key so edits invalidate the entry.
     try:
-        lines = workflow_file.read_text().splitlines()
+        text = Path(workflow_file_str).read_text()
     except OSError:
         return None
 
+    data = _load_yaml_dict(text)
+    if data is not None:
+        rounds = data.get("rounds")
+        if isinstance(rounds, dict):
+            value = rounds.get("output_dir")
+            return str(value) if value else None
+        return None
+
+    # Fallback: hand-rolled indent-aware parser (no libyaml available)
+    lines = text.splitlines()
     in_rounds = False
     rounds_indent = 0
 
@@ -285,12 +479,24 @@ def read_rounds_output_dir(workflow_file: Path) -> Optional[str]:
     return None
 
 
+def read_rounds_output_dir(workflow_file: Path) -> Optional[str]:
+    try:
+        mtime_ns = workflow_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _read_rounds_output_dir_cached(str(workflow_file), mtime_ns)
+
+
+# Memoized so helpers can call these freely without repeating the
+# filesystem probes; the underlying readers are mtime-keyed anyway.
+@functools.lru_cache(maxsize=16)
 def resolve_workflow_name(requested: str) -> str:
     if requested != DEFAULT_WORKFLOW:
         return requested
     return read_default_workflow() or requested
 
 
+@functools.lru_cache(maxsize=16)
 def resolve_rounds_dir(workflow_name: str) -> Path:
     workflow_file = Path(f".apr/workflows/{workflow_name}.yaml")
     output_dir = read_rounds_output_dir(workflow_file)
@@ -299,11 +505,6 @@ def resolve_rounds_dir(workflow_name: str) -> Path:
     return Path(f".apr/rounds/{workflow_name}")
 
 
-def round_file(rounds_dir: Path, round_num: int) -> Path:
-    """Path to a specific round output file."""
-    return rounds_dir / f"round_{round_num}.md"
-
-
 def locate_round_file(
     rounds_dir: Path,
     round_num: int,
@@ -311,9 +512,11 @@ def locate_round_file(
     logger: logging.Logger,
 ) -> Optional[Path]:
     """Find a round file even if output_dir doesn't match expectations."""
-    expected = round_file(rounds_dir, round_num)
-    if expected.exists():
-        return expected
+    # String path on the fast hit — called every round, and the glob
+    # fallbacks below only run when the expected location misses.
+    expected_str = f"{os.fspath(rounds_dir)}/round_{round_num}.md"
+    if os.path.exists(expected_str):
+        return Path(expected_str)
 
     candidates: List[Path] = []
     rounds_root = Path(".apr/rounds")
@@ -359,31 +562,67 @@ def metrics_file(workflow: str) -> Path:
     return Path(f".apr/analytics/{workflow}/metrics.json")
 
 
+def _round_num_from_name(name: str) -> Optional[int]:
+    """Round number from a 'round_<N>.md' filename, or None.
+
+    Slice-and-int beats a compiled regex for this fixed shape, so no
+    pattern object is needed anywhere.
+    """
+    if not (name.startswith("round_") and name.endswith(".md")):
+        return None
+    try:
+        return int(name[6:-3])
+    except ValueError:
+        return None
+
+
+def _newest_round_mtime(rounds_dir: Path) -> Optional[float]:
+    """mtime of the newest round_*.md file, or None when none exist."""
+    newest: Optional[float] = None
+    try:
+        with os.scandir(rounds_dir) as it:
+            for entry in it:
+                if _round_num_from_name(entry.name) is None:
+                    continue
+                mtime = entry.stat().st_mtime
+                if newest is None or mtime > newest:
+                    newest = mtime
+    except OSError:
+        return None
+    return newest
+
+
 def detect_last_round(rounds_dir: Path) -> int:
     """Find the highest completed round number from filesystem."""
-    if not rounds_dir.exists():
-        return 0
-
     highest = 0
-    for f in rounds_dir.glob("round_*.md"):
-        match = re.search(r"round_(\d+)\.md$", f.name)
-        if match:
-            n = int(match.group(1))
-            if f.stat().st_size > 0:
-                highest = max(highest, n)
+    try:
+        with os.scandir(rounds_dir) as it:
+            # DirEntry caches stat info from readdir — one syscall per
+            # entry instead of a glob pass plus a stat per match.
+            for entry in it:
+                n = _round_num_from_name(entry.name)
+                if n is not None and n > highest and entry.stat().st_size > 0:
+                    highest = n
+    except OSError:
+        return 0
     return highest
 
 
+# Known locations of the stability score in `apr stats` JSON, in
+# preference order. Compiled once; _extract_stability_score returns on
+# the first candidate that parses instead of sweeping a fresh list.
+_SCORE_EXTRACTORS = (
+    lambda d: (d.get("convergence") or {}).get("score"),
+    lambda d: (d.get("convergence") or {}).get("confidence"),
+    lambda d: (d.get("convergence") or {}).get("stability_score"),
+    lambda d: d.get("convergence_score"),
+    lambda d: d.get("stability_score"),
+)
+
+
 def _extract_stability_score(data: Dict[str, Any]) -> Optional[float]:
-    conv = data.get("convergence") or {}
-    candidates = [
-        conv.get("score"),
-        conv.get("confidence"),
-        conv.get("stability_score"),
-        data.get("convergence_score"),
-        data.get("stability_score"),
-    ]
-    for raw in candidates:
+    for extract in _SCORE_EXTRACTORS:
+        raw = extract(data)
         if raw is None:
             continue
         try:
@@ -407,6 +646,19 @@ def read_stability_score(
 
     Returns percentage (0-100) or None if unavailable.
     """
+    resp = _daemon_call(config, "stats", timeout=30, workflow=workflow)
+    if resp is not None:
+        if resp.get("code") != 0:
+            logger.debug("  Stats exit %s", resp.get('code'))
+            return None
+        try:
+            return _extract_stability_score(
+                _json_loads(resp.get("stdout") or "")
+            )
+        except json.JSONDecodeError:
+            logger.debug("  Stats output not valid JSON")
+            return None
+
     cmd = ["apr", "stats", "--export", "json"]
     if workflow != DEFAULT_WORKFLOW:
         cmd.extend(["-w", workflow])
@@ -420,15 +672,15 @@ def read_stability_score(
             timeout=30,
         )
     except (subprocess.TimeoutExpired, OSError) as e:
-        logger.debug(f"  Stats error: {e}")
+        logger.debug("  Stats error: %s", e)
         return None
 
     if result.returncode != 0 or not result.stdout.strip():
-        logger.debug(f"  Stats exit {result.returncode}")
+        logger.debug("  Stats exit %s", result.returncode)
         return None
 
     try:
-        data = json.loads(result.stdout.strip())
+        data = _json_loads(result.stdout)
     except json.JSONDecodeError:
         logger.debug("  Stats output not valid JSON")
         return None
@@ -441,17 +693,41 @@ def read_stability_score(
 # =============================================================================
 
 
+def _size_and_line_count(path: Path) -> Tuple[int, int]:
+    """Byte size and newline count of ``path`` without decoding it.
+
+    Streams in 64KB chunks so memory stays bounded no matter how big a
+    round file grows; bytes.count is a C memchr loop per chunk.
+    """
+    size = 0
+    lines = 0
+    try:
+        with open(path, "rb") as fh:
+            while True:
+                buf = fh.read(65536)
+                if not buf:
+                    break
+                size += len(buf)
+                lines += buf.count(b"\n")
+    except OSError:
+        return 0, 0
+    return size, lines
+
+
 def check_output_truncation(
     rounds_dir: Path,
     round_num: int,
     workflow_name: Optional[str],
-    output_sizes: List[int],
+    output_sizes: "deque[int]",
     logger: logging.Logger,
 ) -> bool:
     """
     Check if a round output file appears truncated.
 
-    Reads the file directly from disk. Uses:
+    Reads only what it needs from disk — the file size, enough of the
+    head to count lines up to the minimum, and a bounded tail for the
+    partial-word heuristics — so the cost is O(1) regardless of how
+    large the round file grows. Uses:
     - Minimum size/line thresholds
     - Partial-word detection (GPT truncation cuts mid-word)
     - Relative size comparison against rolling average
@@ -462,56 +738,73 @@ def check_output_truncation(
         return True
 
     try:
-        content = rf.read_text(encoding="utf-8", errors="replace")
+        st = rf.stat()
     except OSError as e:
         logger.warning(f"Cannot read round {round_num} output: {e}")
         return True
 
-    chars = len(content)
-    lines = content.count("\n")
+    # Byte count ≈ char count for the ASCII-heavy markdown APR emits,
+    # and matches what _seed_output_sizes feeds the rolling average.
+    chars = st.st_size
 
     if chars < MIN_OUTPUT_CHARS:
         logger.warning(f"Round {round_num} too short: {chars} chars")
         return True
 
+    lines = 0
+    try:
+        with rf.open("rb") as f:
+            # Count newlines in bounded chunks, stopping as soon as the
+            # minimum is met — no need for an exact total.
+            while lines < MIN_OUTPUT_LINES:
+                buf = f.read(65536)
+                if not buf:
+                    break
+                lines += buf.count(b"\n")
+            f.seek(max(0, chars - TRUNCATION_TAIL_BYTES))
+            tail = f.read().decode("utf-8", errors="replace")
+    except OSError as e:
+        logger.warning(f"Cannot read round {round_num} output: {e}")
+        return True
+
     if lines < MIN_OUTPUT_LINES:
         logger.warning(f"Round {round_num} too few lines: {lines}")
         return True
 
-    # Partial-word detection
-    stripped = content.rstrip()
+    # Partial-word detection (on the tail window only). The heuristics
+    # need just the last token and last line, so take them from the end
+    # directly instead of tokenizing/splitlines-ing the whole tail.
+    stripped = tail.rstrip()
     if stripped:
-        tokens = stripped.split()
-        if tokens:
-            last = tokens[-1]
+        last = stripped.rsplit(None, 1)[-1]
+        last_line = stripped[stripped.rfind("\n") + 1:]
 
-            # Incomplete code fence
-            if stripped.endswith("``") and not stripped.endswith("```"):
-                logger.warning(
-                    f"Round {round_num} truncated: incomplete code fence"
-                )
-                return True
+        # Incomplete code fence
+        if stripped.endswith("``") and not stripped.endswith("```"):
+            logger.warning(
+                f"Round {round_num} truncated: incomplete code fence"
+            )
+            return True
 
-            # No-vowel fragment (e.g. "implementt", "specifc")
-            if (
-                len(last) > 3
-                and last[-1].isalpha()
-                and not any(c in last.lower() for c in "aeiouy")
-            ):
-                logger.warning(
-                    f"Round {round_num} truncated: "
-                    f"no-vowel fragment '{last}'"
-                )
-                return True
+        # No-vowel fragment (e.g. "implementt", "specifc")
+        if (
+            len(last) > 3
+            and last[-1].isalpha()
+            and _VOWEL_BYTES.isdisjoint(last.encode("ascii", "replace"))
+        ):
+            logger.warning(
+                f"Round {round_num} truncated: "
+                f"no-vowel fragment '{last}'"
+            )
+            return True
 
-            # Ends on a heading with nothing after it
-            last_line = stripped.splitlines()[-1]
-            if last_line.startswith("#") and chars < 1000:
-                logger.warning(
-                    f"Round {round_num} truncated: "
-                    f"ends with heading, only {chars} chars"
-                )
-                return True
+        # Ends on a heading with nothing after it
+        if last_line.startswith("#") and chars < 1000:
+            logger.warning(
+                f"Round {round_num} truncated: "
+                f"ends with heading, only {chars} chars"
+            )
+            return True
 
     # Relative size: <30% of rolling average is suspicious.
     # Require at least 3 samples before comparing — early rounds after
@@ -525,7 +818,7 @@ def check_output_truncation(
             )
             return True
 
-    logger.debug(f"Round {round_num} OK: {chars} chars, {lines} lines")
+    logger.debug("Round %s OK: %s chars", round_num, chars)
     return False
 
 
@@ -534,6 +827,12 @@ def check_output_truncation(
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which with the PATH walk done once per executable."""
+    return shutil.which(name)
+
+
 def check_tailscale(host: str, port: int) -> bool:
     """Quick TCP check to Oracle."""
     try:
@@ -543,6 +842,17 @@ def check_tailscale(host: str, port: int) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _robot_status_env() -> Dict[str, str]:
+    """Cached env for `apr robot status` — callers must not mutate."""
+    return {
+        **os.environ,
+        "NO_COLOR": "1",
+        "APR_CHECK_UPDATES": "0",
+        "APR_OUTPUT_FORMAT": "json",
+    }
+
+
 def check_apr_status(logger: logging.Logger) -> bool:
     """
     Verify APR is configured via `apr robot status`.
@@ -550,12 +860,7 @@ def check_apr_status(logger: logging.Logger) -> bool:
     This is the one robot mode call we keep — it gives structured
     data about configuration state in a single request.
     """
-    env = os.environ.copy()
-    env.update({
-        "NO_COLOR": "1",
-        "APR_CHECK_UPDATES": "0",
-        "APR_OUTPUT_FORMAT": "json",
-    })
+    env = _robot_status_env()
 
     try:
         result = subprocess.run(
@@ -572,7 +877,7 @@ def check_apr_status(logger: logging.Logger) -> bool:
         return False
 
     try:
-        data = json.loads(result.stdout.strip())
+        data = _json_loads(result.stdout)
     except json.JSONDecodeError:
         logger.error("  ❌ apr robot status returned invalid JSON")
         return False
@@ -660,17 +965,203 @@ def check_workflow_exists(workflow: str, logger: logging.Logger) -> bool:
 
 
 def build_env(config: Config) -> Dict[str, str]:
-    """Build environment for APR subprocess calls."""
-    env = os.environ.copy()
-    if config.oracle_host and config.oracle_port:
-        env["APR_ORACLE_REMOTE_HOST"] = (
-            f"{config.oracle_host}:{config.oracle_port}"
-        )
-    if config.oracle_token:
-        env["APR_ORACLE_REMOTE_TOKEN"] = config.oracle_token
-    env.setdefault("APR_CHECK_UPDATES", "0")
-    env.setdefault("NO_COLOR", "1")
-    return env
+    """Environment for APR subprocess calls.
+
+    Returns the template cached on Config — callers must not mutate it
+    (take a `dict(...)` copy if they need to).
+    """
+    return config._subprocess_env
+
+
+class AprClient:
+    """
+    Persistent `apr` daemon connection over a Unix domain socket.
+
+    Every one-shot `apr` invocation pays interpreter startup inside the
+    CLI; across a long run that adds up to minutes. The client spawns
+    `apr --daemon --socket <path>` once and exchanges length-prefixed
+    JSON frames instead. Requests look like `{"cmd": "run", "round": N}`;
+    responses are a stream of `{"type": "stderr", "line": ...}` frames
+    (forwarded to the debug log) terminated by a
+    `{"type": "result", "code": N, "stdout": ...}` frame.
+
+    Installed apr builds without daemon support exit immediately on the
+    unknown flag; that is detected on first use and `call` returns None
+    forever after, so callers fall back to one-shot subprocesses.
+    """
+
+    SPAWN_TIMEOUT = 5  # seconds to wait for the daemon socket
+
+    @property
+    def unsupported(self) -> bool:
+        """True once the installed apr is known to lack daemon mode."""
+        return self._unsupported
+
+    def __init__(self, config: Config, logger: logging.Logger):
+        self.config = config
+        self.logger = logger
+        self._proc: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self._unsupported = False
+
+    def call(
+        self,
+        command: str,
+        timeout: int,
+        idempotent: bool = True,
+        **params: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send one request and wait for its result frame.
+
+        Returns the result dict, or None when the daemon is unavailable
+        (caller should fall back to a one-shot subprocess). Streamed
+        stderr lines are folded into the result under "stderr" so
+        callers can apply the same diagnostics as the one-shot path.
+
+        With idempotent=False a failure *after* the request was sent
+        returns a synthetic error frame (code None) instead of None —
+        the command may already be executing, so the caller must not
+        fall back and run it a second time.
+        """
+        if not self._ensure_connection():
+            return None
+        assert self._sock is not None
+
+        request = {"cmd": command}
+        request.update(params)
+        frame = json.dumps(request).encode("utf-8")
+
+        sent = False
+        stderr_lines: List[str] = []
+        try:
+            self._sock.settimeout(timeout)
+            self._sock.sendall(len(frame).to_bytes(4, "big") + frame)
+            sent = True
+            while True:
+                response = self._read_frame()
+                if response.get("type") == "stderr":
+                    line = response.get("line", "")
+                    stderr_lines.append(line)
+                    self.logger.debug("  [apr] %s", line)
+                    continue
+                if stderr_lines:
+                    response.setdefault("stderr", "\n".join(stderr_lines))
+                return response
+        except (OSError, ValueError, json.JSONDecodeError) as e:
+            self.logger.debug("  apr daemon call failed: %s", e)
+            self._teardown()
+            self._unsupported = True
+            if sent and not idempotent:
+                return {
+                    "code": None,
+                    "error": f"apr daemon connection lost: {e}",
+                    "stderr": "\n".join(stderr_lines),
+                }
+            return None
+
+    def close(self):
+        """Shut down the daemon and its socket, if running."""
+        self._teardown()
+
+    # ----- Internals -----
+
+    def _ensure_connection(self) -> bool:
+        if self._unsupported:
+            return False
+        if self._sock is not None:
+            return True
+
+        socket_path = self.config.log_dir / "apr-daemon.sock"
+        socket_path.unlink(missing_ok=True)
+        try:
+            self._proc = subprocess.Popen(
+                ["apr", "--daemon", "--socket", str(socket_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=build_env(self.config),
+            )
+        except OSError as e:
+            self.logger.debug("  apr daemon spawn failed: %s", e)
+            self._unsupported = True
+            return False
+
+        deadline = time.time() + self.SPAWN_TIMEOUT
+        while time.time() < deadline:
+            if self._proc.poll() is not None:
+                # apr rejected --daemon (older build) — fall back for good
+                self.logger.debug(
+                    "  apr daemon exited (code %s); "
+                    "using one-shot subprocess calls",
+                    self._proc.returncode,
+                )
+                self._unsupported = True
+                return False
+            if socket_path.exists():
+                break
+            time.sleep(0.1)
+        else:
+            self.logger.debug("  apr daemon socket never appeared")
+            self._teardown()
+            self._unsupported = True
+            return False
+
+        try:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(str(socket_path))
+        except OSError as e:
+            self.logger.debug("  apr daemon connect failed: %s", e)
+            self._teardown()
+            self._unsupported = True
+            return False
+        return True
+
+    def _read_frame(self) -> Dict[str, Any]:
+        header = self._recv_exact(4)
+        length = int.from_bytes(header, "big")
+        return _json_loads(self._recv_exact(length))
+
+    def _recv_exact(self, n: int) -> bytes:
+        assert self._sock is not None
+        chunks = []
+        while n > 0:
+            chunk = self._sock.recv(n)
+            if not chunk:
+                raise OSError("apr daemon closed connection")
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b"".join(chunks)
+
+    def _teardown(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.terminate()
+                try:
+                    self._proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+            self._proc = None
+
+
+def _daemon_call(
+    config: Config,
+    command: str,
+    timeout: int,
+    idempotent: bool = True,
+    **params: Any,
+) -> Optional[Dict[str, Any]]:
+    """Route a call through the daemon client if one is attached."""
+    if config.apr_client is None:
+        return None
+    return config.apr_client.call(
+        command, timeout=timeout, idempotent=idempotent, **params
+    )
 
 
 def _clear_stale_oracle_session(config: Config, logger: logging.Logger) -> None:
@@ -692,11 +1183,90 @@ def _clear_stale_oracle_session(config: Config, logger: logging.Logger) -> None:
             oracle_cmd, capture_output=True, text=True,
             env=env, timeout=30,
         )
-        logger.debug(f"  Session clear exit={r.returncode}")
+        logger.debug("  Session clear exit=%s", r.returncode)
         if r.stderr:
-            logger.debug(f"  {r.stderr.strip()[:200]}")
+            logger.debug("  %s", r.stderr.strip()[:200])
     except Exception as exc:
-        logger.debug(f"  Session clear failed: {exc}")
+        logger.debug("  Session clear failed: %s", exc)
+
+
+def _run_apr_attempt(
+    cmd: List[str],
+    env: Dict[str, str],
+    logger: logging.Logger,
+) -> Tuple[Optional[int], str, str]:
+    """
+    Run one `apr run` attempt, streaming stderr to the debug log live.
+
+    APR's stderr carries human-readable progress; buffering it until the
+    round finishes (up to an hour) loses observability and holds the
+    whole stream in memory. A reader thread forwards each line as it
+    arrives instead.
+
+    Returns (returncode, stdout, stderr); returncode is None on timeout.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        env=env,
+    )
+    stdout_parts: List[str] = []
+    stderr_lines: List[str] = []
+
+    def _pump_stdout():
+        assert proc.stdout is not None
+        stdout_parts.append(proc.stdout.read())
+
+    def _pump_stderr():
+        assert proc.stderr is not None
+        for line in proc.stderr:
+            line = line.rstrip()
+            stderr_lines.append(line)
+            logger.debug("  [apr] %s", line)
+
+    pumps = [
+        threading.Thread(target=_pump_stdout, daemon=True),
+        threading.Thread(target=_pump_stderr, daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+
+    try:
+        returncode: Optional[int] = proc.wait(timeout=ROUND_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        returncode = None
+    for pump in pumps:
+        pump.join(timeout=5)
+
+    return returncode, "".join(stdout_parts), "\n".join(stderr_lines)
+
+
+# apr run exit codes — shared by the daemon and one-shot paths
+_APR_EXIT_MESSAGES = {
+    2: "Usage error",
+    3: "Dependency error (Oracle not found)",
+    4: "Config error (missing files or workflow)",
+    10: "Network error",
+}
+
+
+def _apr_error_message(returncode: Optional[int], stderr: str) -> str:
+    """Map an apr exit code to a message, with the last stderr line."""
+    msg = _APR_EXIT_MESSAGES.get(returncode, f"Exit code {returncode}")
+    stderr_lines = stderr.strip().splitlines()
+    if stderr_lines:
+        msg += f" — {stderr_lines[-1][:200]}"
+    return msg
+
+
+def _is_stale_session(output: str) -> bool:
+    """Oracle refuses duplicate slugs with this signature."""
+    return "already running" in output and "rerun with --force" in output
 
 
 def run_apr_round(
@@ -712,77 +1282,72 @@ def run_apr_round(
 
     Returns (success, error_message).
     """
+    # idempotent=False: a round is not safe to re-run, so a daemon
+    # failure after dispatch must surface as an error here instead of
+    # falling through to the one-shot path.
+    resp = _daemon_call(
+        config, "run",
+        timeout=ROUND_TIMEOUT_SECONDS, idempotent=False,
+        round=round_num, workflow=config.workflow, wait=True,
+    )
+    if resp is not None:
+        if resp.get("code") == 0:
+            return True, ""
+        if resp.get("code") is None:
+            return False, resp.get("error", "apr daemon connection lost")
+        combined = f"{resp.get('stdout', '')}\n{resp.get('stderr', '')}"
+        if _is_stale_session(combined):
+            logger.warning(
+                "  ⚠️  Stale Oracle session detected — retrying with "
+                "--force via oracle CLI"
+            )
+            _clear_stale_oracle_session(config, logger)
+            retry = _daemon_call(
+                config, "run",
+                timeout=ROUND_TIMEOUT_SECONDS, idempotent=False,
+                round=round_num, workflow=config.workflow, wait=True,
+            )
+            if retry is None:
+                return False, "apr daemon unavailable for post-force retry"
+            if retry.get("code") == 0:
+                return True, ""
+            resp = retry
+        return False, _apr_error_message(
+            resp.get("code"), resp.get("stderr", "")
+        )
+
     cmd = ["apr", "run", str(round_num), "--wait"]
     if config.workflow != DEFAULT_WORKFLOW:
         cmd.extend(["-w", config.workflow])
 
     env = build_env(config)
-    logger.debug(f"Running: {' '.join(cmd)}")
-    logger.debug(f"  env: APR_ORACLE_REMOTE_HOST={env.get('APR_ORACLE_REMOTE_HOST', '<unset>')}")
-    logger.debug(f"  env: APR_ORACLE_MIN_STABLE_MS={env.get('APR_ORACLE_MIN_STABLE_MS', '<unset>')}")
-    logger.debug(f"  env: APR_ORACLE_SETTLE_WINDOW_MS={env.get('APR_ORACLE_SETTLE_WINDOW_MS', '<unset>')}")
+    logger.debug("Running: %s", ' '.join(cmd))
+    logger.debug("  env: APR_ORACLE_REMOTE_HOST=%s", env.get('APR_ORACLE_REMOTE_HOST', '<unset>'))
+    logger.debug("  env: APR_ORACLE_MIN_STABLE_MS=%s", env.get('APR_ORACLE_MIN_STABLE_MS', '<unset>'))
+    logger.debug("  env: APR_ORACLE_SETTLE_WINDOW_MS=%s", env.get('APR_ORACLE_SETTLE_WINDOW_MS', '<unset>'))
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=ROUND_TIMEOUT_SECONDS,
-        )
-    except subprocess.TimeoutExpired:
+    returncode, stdout, stderr = _run_apr_attempt(cmd, env, logger)
+    if returncode is None:
         return False, f"Timed out after {ROUND_TIMEOUT_SECONDS}s"
 
-    # Log APR's stderr (human-readable progress)
-    if result.stderr:
-        for line in result.stderr.strip().splitlines():
-            logger.debug(f"  [apr] {line.rstrip()}")
-
-    if result.returncode == 0:
+    if returncode == 0:
         return True, ""
 
     # Detect stale session blocking — Oracle refuses duplicate slugs.
     # If found, clear it by starting a force-run directly via oracle CLI,
     # then retry via apr run.
-    combined_output = (result.stdout or "") + (result.stderr or "")
-    if "already running" in combined_output and "rerun with --force" in combined_output:
+    combined_output = stdout + stderr
+    if _is_stale_session(combined_output):
         logger.warning("  ⚠️  Stale Oracle session detected — retrying with --force via oracle CLI")
         _clear_stale_oracle_session(config, logger)
         # Retry the apr run once more
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                env=env,
-                timeout=ROUND_TIMEOUT_SECONDS,
-            )
-        except subprocess.TimeoutExpired:
+        returncode, stdout, stderr = _run_apr_attempt(cmd, env, logger)
+        if returncode is None:
             return False, f"Timed out after {ROUND_TIMEOUT_SECONDS}s (post-force retry)"
-        if result.stderr:
-            for line in result.stderr.strip().splitlines():
-                logger.debug(f"  [apr] {line.rstrip()}")
-        if result.returncode == 0:
+        if returncode == 0:
             return True, ""
 
-    # Map exit codes
-    error_map = {
-        2: "Usage error",
-        3: "Dependency error (Oracle not found)",
-        4: "Config error (missing files or workflow)",
-        10: "Network error",
-    }
-    msg = error_map.get(
-        result.returncode,
-        f"Exit code {result.returncode}"
-    )
-
-    # Append last line of stderr for context
-    stderr_lines = result.stderr.strip().splitlines()
-    if stderr_lines:
-        msg += f" — {stderr_lines[-1][:200]}"
-
-    return False, msg
+    return False, _apr_error_message(returncode, stderr)
 
 
 def attempt_cdp_recovery(
@@ -816,6 +1381,7 @@ def attempt_cdp_recovery(
         "-o", "BatchMode=yes",
         "-o", "ConnectTimeout=10",
         "-o", "StrictHostKeyChecking=accept-new",
+        *SSH_MUX_OPTS,
         host,
         f"NODE_PATH=/opt/homebrew/lib/node_modules /opt/homebrew/bin/node {script} --timeout 120 --min-length {MIN_OUTPUT_CHARS}",
     ]
@@ -858,8 +1424,30 @@ def attempt_cdp_recovery(
     return recovered
 
 
+def close_ssh_control_master(host: str, logger: logging.Logger) -> None:
+    """Tear down the multiplexed SSH master connection, if any."""
+    try:
+        subprocess.run(
+            ["ssh", "-O", "exit", "-o", f"ControlPath={SSH_CONTROL_PATH}", host],
+            capture_output=True, timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug("  SSH master teardown failed: %s", e)
+
+
 def run_backfill(config: Config, logger: logging.Logger, force: bool = False) -> bool:
     """Run `apr backfill` to update analytics metrics."""
+    resp = _daemon_call(
+        config, "backfill",
+        timeout=60, workflow=config.workflow, force=force,
+    )
+    if resp is not None:
+        if resp.get("code") == 0:
+            logger.debug("  Backfill complete")
+            return True
+        logger.debug("  Backfill exit %s", resp.get('code'))
+        return False
+
     cmd = ["apr", "backfill"]
     if force:
         cmd.append("--force")
@@ -875,12 +1463,72 @@ def run_backfill(config: Config, logger: logging.Logger, force: bool = False) ->
         if result.returncode == 0:
             logger.debug("  Backfill complete")
             return True
-        logger.debug(f"  Backfill exit {result.returncode}")
+        logger.debug("  Backfill exit %s", result.returncode)
     except (subprocess.TimeoutExpired, OSError) as e:
-        logger.debug(f"  Backfill error: {e}")
+        logger.debug("  Backfill error: %s", e)
     return False
 
 
+def run_stats_and_backfill(
+    config: Config,
+    logger: logging.Logger,
+) -> Tuple[bool, Optional[float]]:
+    """
+    Run `apr backfill --force` and `apr stats --export json` as one
+    subprocess invocation.
+
+    Both run once per round; batching them saves a full fork/exec +
+    interpreter startup per round. A sentinel line separates backfill
+    output from the stats JSON on stdout.
+
+    Returns (backfill_ok, stability_pct) where stability_pct is a
+    percentage (0-100) or None if unavailable.
+    """
+    # With a working daemon there is no per-call startup to amortize,
+    # so two plain calls are just as cheap as the batched script.
+    if config.apr_client is not None and not config.apr_client.unsupported:
+        backfill_ok = run_backfill(config, logger, force=True)
+        if not backfill_ok:
+            return False, None
+        return True, read_stability_score(config.workflow, config, logger)
+
+    wf_args = ["-w", config.workflow] if config.workflow != DEFAULT_WORKFLOW else []
+    script = " && ".join([
+        shlex.join(["apr", "backfill", "--force"] + wf_args),
+        shlex.join(["echo", STATS_DELIMITER]),
+        shlex.join(["apr", "stats", "--export", "json"] + wf_args),
+    ])
+
+    try:
+        result = subprocess.run(
+            ["bash", "-c", script],
+            capture_output=True, text=True,
+            env=build_env(config), timeout=90,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug("  Backfill/stats error: %s", e)
+        return False, None
+
+    _, sep, stats_out = result.stdout.partition(STATS_DELIMITER)
+    if not sep:
+        # backfill failed, so the && chain never reached the sentinel
+        logger.debug("  Backfill exit %s", result.returncode)
+        return False, None
+    logger.debug("  Backfill complete")
+
+    if result.returncode != 0 or not stats_out.strip():
+        logger.debug("  Stats exit %s", result.returncode)
+        return True, None
+
+    try:
+        data = _json_loads(stats_out)
+    except json.JSONDecodeError:
+        logger.debug("  Stats output not valid JSON")
+        return True, None
+
+    return True, _extract_stability_score(data)
+
+
 def run_integrate(
     round_num: int,
     config: Config,
@@ -910,10 +1558,10 @@ def run_integrate(
         return False
 
     # Try Claude Code first
-    if shutil.which("claude"):
+    if config.claude_path:
         try:
             claude_result = subprocess.run(
-                ["claude", "-p", "--allowedTools", "Read Edit Write Bash", "--permission-mode", "bypassPermissions", "--append-system-prompt", "You MUST use the Edit or Write tool to apply changes directly to the files. Do not just describe the changes in your output.", "-"],
+                [config.claude_path, "-p", "--allowedTools", "Read Edit Write Bash", "--permission-mode", "bypassPermissions", "--append-system-prompt", "You MUST use the Edit or Write tool to apply changes directly to the files. Do not just describe the changes in your output.", "-"],
                 input=prompt,
                 capture_output=True, text=True,
                 timeout=3600,
@@ -922,7 +1570,7 @@ def run_integrate(
                 # Log Claude output for debugging
                 out_file = config.log_dir / f"integrate_claude_round_{round_num}.log"
                 out_file.write_text(claude_result.stdout[:5000] if claude_result.stdout else "(no output)")
-                logger.debug(f"  Claude output saved to {out_file}")
+                logger.debug("  Claude output saved to %s", out_file)
                 logger.info("  ✅ Claude Code integration complete")
                 return True
             logger.warning(
@@ -949,76 +1597,71 @@ def run_integrate(
 # =============================================================================
 
 
+# Single bash pipeline for the per-round commit step. Each line of
+# stdout is a tagged status message (COMMIT/SHA/PUSH) parsed by
+# git_commit_and_push — one fork/exec instead of six git invocations.
+_GIT_PIPELINE = """\
+set -u
+git add -u >/dev/null 2>&1
+git add --all -- . ':(exclude).apr' >/dev/null 2>&1
+if ! out=$(git commit -m "$1" 2>&1); then
+    case "$out" in
+        *"nothing to commit"*) echo "COMMIT nothing" ;;
+        *) echo "COMMIT error ${out##*$'\\n'}" ;;
+    esac
+    exit 0
+fi
+echo "SHA $(git rev-parse --short HEAD)"
+git pull --rebase >/dev/null 2>&1 || true
+if push_err=$(git push 2>&1 >/dev/null); then
+    echo "PUSH ok"
+else
+    echo "PUSH fail ${push_err##*$'\\n'}"
+fi
+"""
+
+_GIT_PIPELINE_TIMEOUT = 180  # covers add + commit + pull + push
+
+
 def git_commit_and_push(
     round_num: int,
     conv_info: str,
     logger: logging.Logger,
 ) -> Optional[str]:
-    """Commit and push. Returns short SHA or None."""
-    try:
-        subprocess.run(
-            ["git", "add", "-u"], capture_output=True, timeout=30
-        )
-        status = subprocess.run(
-            ["git", "status", "--porcelain", "-z"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if status.returncode == 0 and status.stdout:
-            paths = []
-            for entry in status.stdout.split("\0"):
-                if not entry.startswith("?? "):
-                    continue
-                path = entry[3:]
-                if path.startswith(".apr/"):
-                    continue
-                if path:
-                    paths.append(path)
-            if paths:
-                subprocess.run(
-                    ["git", "add", "--"] + paths,
-                    capture_output=True, timeout=30,
-                )
-
-        msg = f"apr-auto: round {round_num}"
-        if conv_info:
-            msg += f" ({conv_info})"
+    """Commit and push via one git pipeline. Returns short SHA or None."""
+    msg = f"apr-auto: round {round_num}"
+    if conv_info:
+        msg += f" ({conv_info})"
 
+    try:
         result = subprocess.run(
-            ["git", "commit", "-m", msg],
-            capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            if "nothing to commit" in (result.stdout + result.stderr):
-                return None
-            logger.debug(f"  Commit issue: {result.stderr[:200]}")
-            return None
-
-        sha_result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True, text=True, timeout=10,
-        )
-        sha = sha_result.stdout.strip() if sha_result.returncode == 0 else ""
-
-        subprocess.run(
-            ["git", "pull", "--rebase"],
-            capture_output=True, text=True, timeout=60,
-        )
-
-        push_result = subprocess.run(
-            ["git", "push"],
-            capture_output=True, text=True, timeout=60,
+            ["bash", "-c", _GIT_PIPELINE, "apr-auto-git", msg],
+            capture_output=True, text=True,
+            timeout=_GIT_PIPELINE_TIMEOUT,
         )
-        if push_result.returncode == 0:
-            logger.info(f"  📦 Committed + pushed ({sha})")
-        else:
-            logger.warning(f"  ⚠️  Push failed: {push_result.stderr[:200]}")
-
-        return sha
-
     except (subprocess.TimeoutExpired, OSError) as e:
         logger.warning(f"  ⚠️  Git error: {e}")
         return None
 
+    sha: Optional[str] = None
+    for line in result.stdout.splitlines():
+        tag, _, rest = line.partition(" ")
+        if tag == "COMMIT":
+            status, _, detail = rest.partition(" ")
+            if status != "nothing":
+                logger.debug("  Commit issue: %s", detail[:200])
+            return None
+        if tag == "SHA":
+            sha = rest.strip() or None
+        elif tag == "PUSH":
+            status, _, detail = rest.partition(" ")
+            if status == "ok":
+                logger.info(f"  📦 Committed + pushed ({sha})")
+            else:
+                logger.warning(f"  ⚠️  Push failed: {detail[:200]}")
+
+    return sha
+
 
 # =============================================================================
 # Notification + Status
@@ -1027,61 +1670,146 @@ def git_commit_and_push(
 
 def notify(message: str, config: Config, logger: logging.Logger):
     """Run notification command if configured."""
-    if not config.notify_cmd:
+    cmd = config._notify_argv
+    if not cmd:
         return
     try:
-        cmd = shlex.split(config.notify_cmd)
-        if not cmd:
-            return
         subprocess.run(
             cmd,
             input=message,
             text=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
     except (subprocess.TimeoutExpired, OSError, ValueError) as e:
-        logger.debug(f"Notify failed: {e}")
+        logger.debug("Notify failed: %s", e)
 
 
-def atomic_write_json(path: Path, payload: Dict[str, Any], indent: int = 2):
-    """Write JSON atomically to avoid partial reads."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = None
+def _write_json_tmpfile(
+    path: Path,
+    payload: Dict[str, Any],
+    indent: bool,
+    durable: bool,
+) -> bool:
+    """Linux O_TMPFILE write path; returns False if unavailable.
+
+    The JSON is written to an unnamed inode that vanishes automatically
+    if the process dies mid-write — no orphaned temp entry is ever
+    visible in the directory. linkat refuses to overwrite, so the inode
+    is linked in under a scratch name and os.replace does the final
+    atomic swap.
+    """
+    if not hasattr(os, "O_TMPFILE"):
+        return False
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=path.parent,
-            delete=False,
-            prefix=f"{path.name}.",
-            suffix=".tmp",
-        ) as tmp_file:
-            json.dump(payload, tmp_file, indent=indent)
-            tmp_file.flush()
-            os.fsync(tmp_file.fileno())
-            tmp_path = Path(tmp_file.name)
-        os.replace(tmp_path, path)
-        dir_fd = os.open(path.parent, os.O_DIRECTORY)
+        fd = os.open(path.parent, os.O_TMPFILE | os.O_WRONLY, 0o644)
+    except OSError:
+        # Filesystem without O_TMPFILE support (e.g. some network FS)
+        return False
+    try:
+        with os.fdopen(fd, "wb", closefd=False) as fp:
+            _json_dump_to(fp, payload, indent)
+            fp.flush()
+        if durable:
+            os.fsync(fd)
+        link_name = f".{path.name}.{os.getpid()}.lnk"
+        # dst_dir_fd forces the linkat() code path, which follows the
+        # /proc magic symlink to the unnamed inode; plain link() would
+        # fail with EXDEV.
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
         try:
-            os.fsync(dir_fd)
+            os.link(f"/proc/self/fd/{fd}", link_name, dst_dir_fd=dir_fd)
         finally:
             os.close(dir_fd)
+        link_path = path.parent / link_name
+        try:
+            os.replace(link_path, path)
+        except OSError:
+            try:
+                os.unlink(link_path)
+            except OSError:
+                pass
+            raise
+    finally:
+        os.close(fd)
+    return True
+
+
+def atomic_write_json(
+    path: Path,
+    payload: Dict[str, Any],
+    indent: bool = True,
+    durable: bool = True,
+):
+    """Write JSON atomically to avoid partial reads.
+
+    With durable=False the file and directory fsyncs are skipped — the
+    rename is still atomic, but the data may be lost on power failure.
+    Appropriate for monitoring files rewritten every round.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Hold Ctrl-C / SIGTERM until the rename lands so an interrupt can't
+    # strand a half-written temp file. Delivery resumes on restore.
+    old_mask = signal.pthread_sigmask(
+        signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM}
+    )
+    try:
+        if not _write_json_tmpfile(path, payload, indent, durable):
+            # Portable fallback: named temp file + rename
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                dir=path.parent,
+                delete=False,
+                prefix=f"{path.name}.",
+                suffix=".tmp",
+            ) as tmp_file:
+                _json_dump_to(tmp_file, payload, indent)
+                tmp_file.flush()
+                if durable:
+                    os.fsync(tmp_file.fileno())
+            os.replace(tmp_file.name, path)
+        if durable:
+            dir_fd = os.open(path.parent, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
     except OSError:
         return
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
 
 
 def write_status(
-    log_dir: Path, current_round: int, completed: int, status: str
+    log_dir: Path,
+    current_round: int,
+    completed: int,
+    status: str,
+    durable: bool = False,
 ):
-    """Write machine-readable status for external monitoring."""
+    """Write machine-readable status for external monitoring.
+
+    Non-durable by default — a stale status.json after a crash is
+    harmless and the fsync pair per round is not. Terminal states pass
+    durable=True.
+    """
     payload = {
         "current_round": current_round,
         "rounds_completed": completed,
         "status": status,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": _utcnow_iso(),
     }
-    atomic_write_json(log_dir / "status.json", payload, indent=2)
+    if durable:
+        atomic_write_json(log_dir / "status.json", payload, durable=True)
+        return
+    # Monitoring-only update: a torn write is corrected next round, so
+    # a plain truncating write beats the temp-file + rename machinery.
+    try:
+        with open(log_dir / "status.json", "w", encoding="utf-8") as fp:
+            json.dump(payload, fp, indent=2)
+    except OSError:
+        pass
 
 
 # =============================================================================
@@ -1093,11 +1821,33 @@ class Orchestrator:
     def __init__(self, config: Config, logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self.summary = RunSummary()
+        self.summary = RunSummary(
+            started_at=_utcnow_iso()
+        )
+        self.summary.results = [None] * config.max_rounds
+        self._result_count = 0
         self._shutting_down = False
-        self._output_sizes: List[int] = []
+        # Rolling window for the truncation size heuristic; bounded so a
+        # long run never accumulates more history than the average uses.
+        self._output_sizes: deque[int] = deque(maxlen=16)
         self._truncation_attempts: Dict[int, int] = {}
         self._rounds_dir: Optional[Path] = None
+        # mtime of the newest round file covered by the last successful
+        # backfill — lets no-op rounds skip the backfill subprocess.
+        self._last_backfill_mtime: float = -1.0
+        # Last status.json payload key and write time — retries of the
+        # same round would otherwise rewrite an identical file.
+        self._last_status: Optional[Tuple[int, int, str]] = None
+        self._last_status_time: float = 0.0
+        # Integrate/commit for round N runs here while the cooldown and
+        # setup for round N+1 tick by; one worker keeps results ordered.
+        self._post_round_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="post-round"
+        )
+        self._pending_finalize: Optional[Future] = None
+
+        config.log_dir.mkdir(parents=True, exist_ok=True)
+        config.apr_client = AprClient(config, logger)
 
         signal.signal(signal.SIGINT, self._handle_signal)
         signal.signal(signal.SIGTERM, self._handle_signal)
@@ -1106,86 +1856,202 @@ class Orchestrator:
         self.logger.info("\n⚠️  Shutdown signal received")
         self._shutting_down = True
 
+    def close(self):
+        """Release long-lived resources (apr daemon, SSH master, pool)."""
+        self._post_round_pool.shutdown(wait=True)
+        if self.config.apr_client is not None:
+            self.config.apr_client.close()
+            self.config.apr_client = None
+        if self.config.cdp_recovery_enabled and self.config.cdp_recovery_ssh_host:
+            close_ssh_control_master(
+                self.config.cdp_recovery_ssh_host, self.logger
+            )
+
+    def _preflight_cache_key(self) -> str:
+        """Hash of every config input the preflight checks depend on."""
+        c = self.config
+        raw = repr((
+            c.workflow, c.oracle_host, c.oracle_port,
+            bool(c.oracle_token), c.cdp_recovery_enabled,
+            c.cdp_recovery_ssh_host, c.cdp_recovery_script_path,
+            c.commit, c.integrate,
+        ))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _read_preflight_cache(
+        self, cache_path: Path, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Cached preflight payload if fresh, config-matched and passing.
+
+        Only successes are honoured — replaying a cached failure would
+        hide which check failed and ignore the operator's fix until the
+        TTL expired, defeating the fix-and-retry loop the cache exists
+        to speed up.
+        """
+        try:
+            data = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != cache_key:
+            return None
+        if not data.get("ok"):
+            return None
+        try:
+            age = time.time() - float(data.get("checked_at", 0))
+        except (TypeError, ValueError):
+            return None
+        if not 0 <= age <= PREFLIGHT_CACHE_TTL_SECONDS:
+            return None
+        return data
+
     def preflight(self) -> bool:
         """Verify everything is ready."""
+        cache_path = self.config.log_dir / "preflight.json"
+        cache_key = self._preflight_cache_key()
+
+        if not self.config.dry_run:
+            cached = self._read_preflight_cache(cache_path, cache_key)
+            if cached is not None:
+                self.logger.info("\n🔍 Pre-flight checks (cached)")
+                # Re-apply the git downgrade a fresh run would have made
+                if self.config.commit and not cached.get("git_ok", True):
+                    self.logger.warning(
+                        "  ⚠️  Git not found, commits disabled"
+                    )
+                    self.config.commit = False
+                return True
+
         self.logger.info("\n🔍 Pre-flight checks")
-        ok = True
 
-        if shutil.which("apr"):
-            self.logger.info("  ✅ apr found")
-        else:
-            self.logger.error("  ❌ apr not on PATH")
-            ok = False
+        # Every check below is independent I/O (PATH walks, a TCP
+        # probe, subprocesses, an SSH probe with a 15s timeout) — run
+        # them all concurrently and replay their buffered log lines in
+        # submission order, so wall time is the max latency instead of
+        # the sum and the output stays deterministic.
 
-        host, port = self.config.oracle_host, self.config.oracle_port
-        if host:
-            if not self.config.oracle_token:
-                self.logger.error("  ❌ Oracle token missing (set ORACLE_REMOTE_TOKEN)")
-                ok = False
-            elif check_tailscale(host, port):
-                self.logger.info(f"  ✅ Oracle reachable ({host}:{port})")
-            else:
-                self.logger.error(f"  ❌ Oracle unreachable ({host}:{port})")
-                ok = False
-        else:
-            self.logger.info("  ℹ️  Oracle remote not configured (skipping reachability check)")
+        def check_apr_binary(log) -> bool:
+            if _which("apr"):
+                log.info("  ✅ apr found")
+                return True
+            log.error("  ❌ apr not on PATH")
+            return False
 
-        if not check_apr_status(self.logger):
-            ok = False
+        def check_oracle(log) -> bool:
+            host, port = self.config.oracle_host, self.config.oracle_port
+            if not host:
+                log.info("  ℹ️  Oracle remote not configured (skipping reachability check)")
+                return True
+            if not self.config.oracle_token:
+                log.error("  ❌ Oracle token missing (set ORACLE_REMOTE_TOKEN)")
+                return False
+            if check_tailscale(host, port):
+                log.info(f"  ✅ Oracle reachable ({host}:{port})")
+                return True
+            log.error(f"  ❌ Oracle unreachable ({host}:{port})")
+            return False
 
-        if not check_workflow_exists(self.config.workflow, self.logger):
-            ok = False
+        def check_git(log) -> bool:
+            if not self.config.commit:
+                return True
+            if _which("git"):
+                log.info("  ✅ Git available")
+                return True
+            log.warning("  ⚠️  Git not found, commits disabled")
+            return False
 
-        if self.config.commit:
-            if shutil.which("git"):
-                self.logger.info("  ✅ Git available")
-            else:
-                self.logger.warning(
-                    "  ⚠️  Git not found, commits disabled"
+        def check_claude(log) -> bool:
+            if self.config.integrate and self.config.claude_path:
+                log.info("  ✅ Claude Code available")
+            elif self.config.integrate:
+                log.info(
+                    "  ℹ️  Claude Code not found — "
+                    "prompts saved to files instead"
                 )
-                self.config.commit = False
-
-        if self.config.integrate and shutil.which("claude"):
-            self.logger.info("  ✅ Claude Code available")
-        elif self.config.integrate:
-            self.logger.info(
-                "  ℹ️  Claude Code not found — "
-                "prompts saved to files instead"
-            )
+            return True
 
-        # CDP recovery preflight
-        if self.config.cdp_recovery_enabled:
+        def check_cdp(log) -> bool:
+            if not self.config.cdp_recovery_enabled:
+                return True
             cdp_host = self.config.cdp_recovery_ssh_host
             cdp_script = self.config.cdp_recovery_script_path
-            if cdp_host:
-                try:
-                    probe = subprocess.run(
-                        [
-                            "ssh",
-                            "-o", "BatchMode=yes",
-                            "-o", "ConnectTimeout=5",
-                            cdp_host,
-                            f"test -f {cdp_script} && echo ok",
-                        ],
-                        capture_output=True, text=True, timeout=15,
+            if not cdp_host:
+                log.warning(
+                    "  ⚠️  CDP recovery enabled but no SSH host configured"
+                )
+                return True
+            try:
+                probe = subprocess.run(
+                    [
+                        "ssh",
+                        "-o", "BatchMode=yes",
+                        "-o", "ConnectTimeout=5",
+                        *SSH_MUX_OPTS,
+                        cdp_host,
+                        f"test -f {cdp_script} && echo ok",
+                    ],
+                    capture_output=True, text=True, timeout=15,
+                )
+                if probe.returncode == 0 and "ok" in probe.stdout:
+                    log.info(
+                        f"  ✅ CDP recovery script reachable ({cdp_host})"
                     )
-                    if probe.returncode == 0 and "ok" in probe.stdout:
-                        self.logger.info(
-                            f"  ✅ CDP recovery script reachable ({cdp_host})"
-                        )
-                    else:
-                        self.logger.warning(
-                            f"  ⚠️  CDP recovery script not found on {cdp_host}: "
-                            f"{cdp_script}"
-                        )
-                except (subprocess.TimeoutExpired, OSError) as e:
-                    self.logger.warning(
-                        f"  ⚠️  CDP recovery host unreachable ({cdp_host}): {e}"
+                else:
+                    log.warning(
+                        f"  ⚠️  CDP recovery script not found on {cdp_host}: "
+                        f"{cdp_script}"
                     )
-            else:
-                self.logger.warning(
-                    "  ⚠️  CDP recovery enabled but no SSH host configured"
+            except (subprocess.TimeoutExpired, OSError) as e:
+                log.warning(
+                    f"  ⚠️  CDP recovery host unreachable ({cdp_host}): {e}"
                 )
+            return True
+
+        # (name, check, gates_ok) — non-gating checks only log
+        checks = [
+            ("apr", check_apr_binary, True),
+            ("oracle", check_oracle, True),
+            ("status", check_apr_status, True),
+            (
+                "workflow",
+                lambda log: check_workflow_exists(self.config.workflow, log),
+                True,
+            ),
+            ("git", check_git, False),
+            ("claude", check_claude, False),
+            ("cdp", check_cdp, False),
+        ]
+        buffers = [_LogBuffer() for _ in checks]
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            futures = [
+                ex.submit(fn, buf)
+                for (_, fn, _), buf in zip(checks, buffers)
+            ]
+
+        ok = True
+        git_ok = True
+        for (name, _, gates_ok), buf, fut in zip(checks, buffers, futures):
+            result = fut.result()
+            buf.replay(self.logger)
+            if name == "git":
+                git_ok = result
+                if not result:
+                    self.config.commit = False
+            elif gates_ok and not result:
+                ok = False
+
+        if not self.config.dry_run and ok:
+            # Failures are never cached: the next run must re-probe and
+            # print the failing checks.
+            atomic_write_json(
+                cache_path,
+                {
+                    "key": cache_key,
+                    "ok": ok,
+                    "git_ok": git_ok,
+                    "checked_at": time.time(),
+                },
+                durable=False,
+            )
 
         return ok
 
@@ -1230,6 +2096,9 @@ class Orchestrator:
 
         rounds_dir_path = resolve_rounds_dir(config.workflow)
         self._rounds_dir = rounds_dir_path
+        # String form for paths built every iteration — skips Path's
+        # normalisation/dispatch in the loop body.
+        rounds_dir_str = os.fspath(rounds_dir_path)
         logger.info(f"  📁 Rounds dir: {rounds_dir_path}")
 
         # Detect start
@@ -1252,7 +2121,14 @@ class Orchestrator:
 
         if start > 1:
             logger.info("  📊 Backfilling metrics...")
-            run_backfill(config, logger, force=True)
+            # Incremental here: on resume the existing metrics are almost
+            # always current, and the per-round path force-refreshes anyway.
+            if run_backfill(config, logger, force=False):
+                stamp = _newest_round_mtime(rounds_dir_path)
+                if stamp is not None:
+                    self._last_backfill_mtime = min(
+                        stamp, time.time() - 1.0
+                    )
 
         if config.dry_run:
             logger.info(
@@ -1275,14 +2151,25 @@ class Orchestrator:
                 self.summary.stopped_reason = "shutdown"
                 break
 
+            # Join the previous round's integrate/commit before touching
+            # the summary or launching the next apr run.
+            self._drain_finalize()
+
             logger.info(f"{'─' * 50}")
             logger.info(f"📍 Round {round_num}")
             logger.info(f"{'─' * 50}")
 
-            write_status(
-                config.log_dir, round_num,
-                self.summary.rounds_completed, "running",
+            status_key = (
+                round_num, self.summary.rounds_completed, "running",
             )
+            now = time.time()
+            if (
+                status_key != self._last_status
+                or now - self._last_status_time >= 5.0
+            ):
+                write_status(config.log_dir, *status_key)
+                self._last_status = status_key
+                self._last_status_time = now
 
             # --- Execute via apr run --wait ---
             t0 = time.time()
@@ -1294,10 +2181,11 @@ class Orchestrator:
                 consecutive_failures += 1
                 self.summary.rounds_failed += 1
                 logger.error(f"  ❌ {error_msg}")
-                self.summary.results.append(asdict(RoundResult(
+                self._record_result(RoundResult(
                     round_num=round_num, success=False,
                     error_msg=error_msg, duration_seconds=duration,
-                )))
+                    timestamp=_utcnow_iso(),
+                ).to_dict())
                 if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
                     logger.error(
                         f"\n🛑 {MAX_CONSECUTIVE_FAILURES} consecutive "
@@ -1315,13 +2203,17 @@ class Orchestrator:
             rf = locate_round_file(
                 rounds_dir_path, round_num, config.workflow, logger
             )
-            chars, line_count = 0, 0
+            # line_count is informational only — defer the newline scan
+            # until something actually reports it (-1 = not yet counted),
+            # so a clean round costs a single stat here.
+            chars, line_count = 0, -1
             truncated = False
 
             if rf and rf.exists():
-                content = rf.read_text(encoding="utf-8", errors="replace")
-                chars = len(content)
-                line_count = content.count("\n")
+                try:
+                    chars = rf.stat().st_size
+                except OSError:
+                    chars = 0
             truncated = check_output_truncation(
                 rounds_dir_path, round_num,
                 config.workflow, self._output_sizes, logger,
@@ -1332,17 +2224,23 @@ class Orchestrator:
             if truncated:
                 attempts = self._truncation_attempts.get(round_num, 0) + 1
                 self._truncation_attempts[round_num] = attempts
+                if line_count < 0:
+                    line_count = (
+                        _size_and_line_count(rf)[1] if rf and rf.exists()
+                        else 0
+                    )
                 logger.warning(
                     f"  ⚠️  Output may be truncated "
                     f"({chars} chars, {line_count} lines)"
                 )
 
                 if rf and rf.exists():
-                    backup = rounds_dir_path / (
+                    backup = (
+                        f"{rounds_dir_str}/"
                         f"round_{round_num}.truncated.{attempts}.md"
                     )
                     try:
-                        rf.rename(backup)
+                        os.rename(rf, backup)
                         logger.info(f"  📄 Moved truncated output to {backup}")
                     except OSError as e:
                         logger.warning(f"  ⚠️  Could not move truncated file: {e}")
@@ -1351,7 +2249,9 @@ class Orchestrator:
                 recovered = attempt_cdp_recovery(round_num, config, logger)
                 if recovered:
                     # Write recovered content to the round file
-                    target_path = rf or round_file(rounds_dir_path, round_num)
+                    target_path = rf or Path(
+                        f"{rounds_dir_str}/round_{round_num}.md"
+                    )
                     try:
                         target_path.write_text(recovered, encoding="utf-8")
                         logger.info(
@@ -1388,13 +2288,14 @@ class Orchestrator:
                     # Original retry logic (unchanged)
                     consecutive_failures += 1
                     self.summary.rounds_failed += 1
-                    self.summary.results.append(asdict(RoundResult(
+                    self._record_result(RoundResult(
                         round_num=round_num, success=False,
                         error_msg="output_truncated", duration_seconds=duration,
                         round_chars=chars, round_lines=line_count,
                         truncated=True,
                         cdp_recovery_attempted=recovered is not None or config.cdp_recovery_enabled,
-                    )))
+                        timestamp=_utcnow_iso(),
+                    ).to_dict())
 
                     if attempts < MAX_TRUNCATION_RETRIES:
                         logger.warning(
@@ -1422,17 +2323,47 @@ class Orchestrator:
 
             consecutive_failures = 0
             self.summary.rounds_completed += 1
-            logger.info(
-                f"  ✅ Done ({chars} chars, {line_count} lines, "
-                f"{duration:.0f}s)"
-            )
-
-            # --- Backfill + convergence ---
-            backfill_ok = run_backfill(config, logger, force=True)
+            if line_count >= 0:
+                logger.info(
+                    f"  ✅ Done ({chars} chars, {line_count} lines, "
+                    f"{duration:.0f}s)"
+                )
+            else:
+                logger.info(f"  ✅ Done ({chars} chars, {duration:.0f}s)")
+
+            # --- Backfill + convergence (single batched invocation) ---
+            # Backfill re-walks all rounds; skip it when no round file
+            # has changed since the last successful backfill.
+            newest_mtime = _newest_round_mtime(rounds_dir_path)
+            if rf is not None:
+                # Round output can land outside the resolved rounds dir
+                # (locate_round_file's glob fallback) — fold the file we
+                # just verified into the key so the skip never starves
+                # the metrics of the round that was produced.
+                try:
+                    newest_mtime = max(
+                        newest_mtime or 0.0, rf.stat().st_mtime
+                    )
+                except OSError:
+                    pass
+            if (
+                newest_mtime is not None
+                and newest_mtime <= self._last_backfill_mtime
+            ):
+                logger.debug("  Round outputs unchanged — skipping backfill")
+                backfill_ok = True
+                conv_pct = read_stability_score(config.workflow, config, logger)
+            else:
+                backfill_ok, conv_pct = run_stats_and_backfill(config, logger)
+                if backfill_ok and newest_mtime is not None:
+                    # Clamp a second below now: on coarse-mtime
+                    # filesystems a write landing in the same second as
+                    # the backfill must still compare newer next round.
+                    self._last_backfill_mtime = min(
+                        newest_mtime, time.time() - 1.0
+                    )
             conv_info = ""
-            conv_pct = None
             if backfill_ok:
-                conv_pct = read_stability_score(config.workflow, config, logger)
                 if conv_pct is not None:
                     conv_info = f"{conv_pct:.1f}%"
                     logger.info(f"  📊 Stability score: {conv_info}")
@@ -1441,26 +2372,11 @@ class Orchestrator:
             else:
                 logger.warning("  ⚠️  Backfill failed; convergence unknown")
 
-            # --- Integrate + commit ---
-            integrated = False
-            if config.integrate:
-                logger.info(f"  🔧 Integrating round {round_num}...")
-                integrated = run_integrate(round_num, config, logger)
-
-            committed, commit_sha = False, None
-            if config.commit:
-                sha = git_commit_and_push(round_num, conv_info, logger)
-                if sha:
-                    committed, commit_sha = True, sha
-
-            # --- Record result ---
-            self.summary.results.append(asdict(RoundResult(
-                round_num=round_num, success=True,
-                duration_seconds=duration, convergence_pct=conv_pct,
-                round_chars=chars, round_lines=line_count,
-                truncated=truncated, integrated=integrated,
-                committed=committed, commit_sha=commit_sha,
-            )))
+            # --- Integrate + commit + record (overlaps with cooldown) ---
+            self._pending_finalize = self._post_round_pool.submit(
+                self._finalize_round, round_num, duration,
+                conv_pct, conv_info, chars, line_count, truncated, rf,
+            )
 
             # --- Check convergence ---
             converged = False
@@ -1482,12 +2398,14 @@ class Orchestrator:
             round_num += 1
 
             if config.cooldown > 0 and round_num < end:
-                logger.debug(f"  💤 {config.cooldown}s cooldown...")
+                logger.debug("  💤 %ss cooldown...", config.cooldown)
                 time.sleep(config.cooldown)
 
             logger.info("")
 
         # === End of loop ===
+        self._drain_finalize()
+
         if round_num >= end and not self.summary.stopped_reason:
             self.summary.stopped_reason = "max_rounds_reached"
             logger.warning(
@@ -1495,7 +2413,7 @@ class Orchestrator:
                 f"without {config.convergence_target}% convergence"
             )
 
-        self.summary.finished_at = datetime.now(timezone.utc).isoformat()
+        self.summary.finished_at = _utcnow_iso()
         if not self.summary.stopped_reason:
             self.summary.stopped_reason = "completed"
 
@@ -1505,6 +2423,7 @@ class Orchestrator:
             config.log_dir, round_num,
             self.summary.rounds_completed,
             self.summary.stopped_reason,
+            durable=True,
         )
         notify(
             f"APR auto: {self.summary.stopped_reason} — "
@@ -1514,22 +2433,98 @@ class Orchestrator:
 
     # ----- Helpers -----
 
+    def _finalize_round(
+        self,
+        round_num: int,
+        duration: float,
+        conv_pct: Optional[float],
+        conv_info: str,
+        chars: int,
+        line_count: int,
+        truncated: bool,
+        round_path: Optional[Path] = None,
+    ):
+        """Integrate, commit, and record a successful round.
+
+        Runs on the post-round worker so it overlaps with the cooldown
+        and setup of the next round; _drain_finalize joins it before
+        the summary is touched again. A line_count of -1 means the main
+        loop skipped the newline scan; it is made up here, off the
+        critical path.
+        """
+        config, logger = self.config, self.logger
+
+        if line_count < 0:
+            line_count = (
+                _size_and_line_count(round_path)[1] if round_path else 0
+            )
+
+        integrated = False
+        if config.integrate:
+            logger.info(f"  🔧 Integrating round {round_num}...")
+            integrated = run_integrate(round_num, config, logger)
+
+        committed, commit_sha = False, None
+        if config.commit:
+            sha = git_commit_and_push(round_num, conv_info, logger)
+            if sha:
+                committed, commit_sha = True, sha
+
+        self._record_result(RoundResult(
+            round_num=round_num, success=True,
+            duration_seconds=duration, convergence_pct=conv_pct,
+            round_chars=chars, round_lines=line_count,
+            truncated=truncated, integrated=integrated,
+            committed=committed, commit_sha=commit_sha,
+            timestamp=_utcnow_iso(),
+        ).to_dict())
+
+    def _record_result(self, entry: Dict[str, Any]):
+        """Store a result in the next preallocated summary slot.
+
+        Retries can push the attempt count past max_rounds, in which
+        case the list grows the ordinary way.
+        """
+        results = self.summary.results
+        if self._result_count < len(results):
+            results[self._result_count] = entry
+        else:
+            results.append(entry)
+        self._result_count += 1
+
+    def _drain_finalize(self):
+        """Wait for the pending integrate/commit, if any."""
+        if self._pending_finalize is not None:
+            try:
+                self._pending_finalize.result()
+            finally:
+                self._pending_finalize = None
+
     def _seed_output_sizes(self, rounds_dir: Path, up_to: int):
         """Seed rolling average from last few round files."""
-        for n in range(max(1, up_to - 4), up_to + 1):
-            rf = rounds_dir / f"round_{n}.md"
-            if rf.exists():
-                try:
-                    size = rf.stat().st_size
-                    if size > 0:
-                        self._output_sizes.append(size)
-                except OSError:
-                    pass
+        wanted = {
+            f"round_{n}.md": n for n in range(max(1, up_to - 4), up_to + 1)
+        }
+        sizes: Dict[int, int] = {}
+        try:
+            with os.scandir(rounds_dir) as entries:
+                for entry in entries:
+                    n = wanted.get(entry.name)
+                    if n is not None:
+                        try:
+                            sizes[n] = entry.stat().st_size
+                        except OSError:
+                            pass
+        except OSError:
+            return
+        for n in sorted(sizes):
+            if sizes[n] > 0:
+                self._output_sizes.append(sizes[n])
         if self._output_sizes:
             avg = sum(self._output_sizes) / len(self._output_sizes)
             self.logger.debug(
-                f"  Seeded from {len(self._output_sizes)} rounds "
-                f"(avg {avg:.0f} chars)"
+                "  Seeded from %d rounds (avg %.0f chars)",
+                len(self._output_sizes), avg,
             )
 
     def _print_summary(self):
@@ -1541,16 +2536,26 @@ class Orchestrator:
         self.logger.info(f"  Status:    {s.stopped_reason}")
         self.logger.info(f"  Completed: {s.rounds_completed}")
         self.logger.info(f"  Failed:    {s.rounds_failed}")
-        if s.results:
-            last = s.results[-1]
+        if self._result_count:
+            last = s.results[self._result_count - 1]
             pct = last.get("convergence_pct")
             if pct is not None:
                 self.logger.info(f"  Final:     {pct:.1f}%")
         self.logger.info("=" * 55)
 
     def _save_summary(self):
-        payload = asdict(self.summary)
-        atomic_write_json(self.config.log_dir / "last_run.json", payload, indent=2)
+        s = self.summary
+        # The result entries are already plain dicts — reference them
+        # instead of asdict()'s recursive copy of the whole summary.
+        payload = {
+            "started_at": s.started_at,
+            "finished_at": s.finished_at,
+            "stopped_reason": s.stopped_reason,
+            "rounds_completed": s.rounds_completed,
+            "rounds_failed": s.rounds_failed,
+            "results": s.results[:self._result_count],
+        }
+        atomic_write_json(self.config.log_dir / "last_run.json", payload)
 
 
 # =============================================================================
@@ -1617,7 +2622,11 @@ def parse_args() -> Config:
 def main():
     config = parse_args()
     logger = setup_logging(config.log_dir)
-    Orchestrator(config, logger).run()
+    orchestrator = Orchestrator(config, logger)
+    try:
+        orchestrator.run()
+    finally:
+        orchestrator.close()
 
 
 if __name__ == "__main__":